@@ -3,80 +3,164 @@ Simple in-memory cache for Immich Read-Only Display.
 Caches people list, search suggestions, and other semi-static data.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Optional, Dict
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Dict, List, Tuple
 from threading import Lock
 
+from .config import settings
+
 
 class CacheEntry:
     """A single cache entry with expiration."""
     
     def __init__(self, value: Any, ttl: int):
         self.value = value
-        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        self.expires_at = time.monotonic() + ttl
     
-    def is_expired(self) -> bool:
-        return datetime.utcnow() > self.expires_at
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now > self.expires_at
+
+
+# Number of independently locked shards; must be a power of two
+SHARD_COUNT = 16
 
 
 class CacheManager:
-    """Thread-safe in-memory cache manager."""
+    """Thread-safe in-memory cache manager with per-shard LRU eviction."""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # Each shard holds an equal slice of the overall entry budget
+        self._shard_max_entries = max(1, max_entries // SHARD_COUNT)
+        self._shards: List[Tuple["OrderedDict[str, CacheEntry]", Lock]] = [
+            (OrderedDict(), Lock()) for _ in range(SHARD_COUNT)
+        ]
+        # In-flight loads for get_or_create, only touched from the event loop
+        self._inflight: Dict[str, asyncio.Task] = {}
     
-    def __init__(self):
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = Lock()
+    def _shard(self, key: str) -> Tuple["OrderedDict[str, CacheEntry]", Lock]:
+        """Return the (dict, lock) shard responsible for a key."""
+        return self._shards[hash(key) & (SHARD_COUNT - 1)]
     
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache if it exists and hasn't expired."""
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_expired():
-                del self._cache[key]
-                return None
+        cache, lock = self._shard(key)
+        # dict.get and move_to_end are atomic, so hits never need to take the lock
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if not entry.is_expired():
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                # Evicted or deleted concurrently; the value is still good
+                pass
             return entry.value
+        with lock:
+            # Only drop the entry if it wasn't replaced by a concurrent set
+            if cache.get(key) is entry:
+                del cache[key]
+        return None
     
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """Set a value in cache with TTL in seconds."""
-        with self._lock:
-            self._cache[key] = CacheEntry(value, ttl)
+        cache, lock = self._shard(key)
+        with lock:
+            cache[key] = CacheEntry(value, ttl)
+            cache.move_to_end(key)
+            while len(cache) > self._shard_max_entries:
+                cache.popitem(last=False)
+    
+    async def get_or_create(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = 300
+    ) -> Any:
+        """
+        Get a value from cache, loading it with `loader` on a miss.
+        Concurrent misses for the same key share a single load; loader
+        exceptions propagate to every waiter and nothing is cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, ttl))
+            self._inflight[key] = task
+        # Shield so one disconnecting caller doesn't cancel the shared load
+        return await asyncio.shield(task)
+    
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int
+    ) -> Any:
+        try:
+            value = await loader()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
     
     def delete(self, key: str) -> bool:
         """Delete a key from cache."""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        cache, lock = self._shard(key)
+        with lock:
+            if key in cache:
+                del cache[key]
                 return True
             return False
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
+        for cache, lock in self._shards:
+            with lock:
+                cache.clear()
     
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items() 
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-            return len(expired_keys)
+        removed = 0
+        # Sweep one shard at a time so writers to other shards never wait
+        for cache, lock in self._shards:
+            now = time.monotonic()
+            with lock:
+                # Snapshot first: lock-free hits may reorder the dict meanwhile
+                expired_keys = [
+                    key for key, entry in list(cache.items())
+                    if entry.is_expired(now)
+                ]
+                for key in expired_keys:
+                    del cache[key]
+            removed += len(expired_keys)
+        return removed
     
     def stats(self) -> dict:
         """Get cache statistics."""
-        with self._lock:
-            valid = sum(1 for e in self._cache.values() if not e.is_expired())
-            expired = len(self._cache) - valid
-            return {
-                "total_entries": len(self._cache),
-                "valid_entries": valid,
-                "expired_entries": expired
-            }
+        total = 0
+        valid = 0
+        now = time.monotonic()
+        for cache, lock in self._shards:
+            with lock:
+                total += len(cache)
+                valid += sum(1 for e in list(cache.values()) if not e.is_expired(now))
+        return {
+            "total_entries": total,
+            "valid_entries": valid,
+            "expired_entries": total - valid
+        }
 
 
 # Global cache instance
-cache_manager = CacheManager()
+cache_manager = CacheManager(max_entries=settings.cache_max_entries)
+
+# Per-asset type lookups get their own budget so gallery browsing can't
+# evict the endpoint bodies held in cache_manager
+asset_type_cache = CacheManager(max_entries=4096)
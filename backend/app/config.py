@@ -5,7 +5,7 @@ Uses environment variables for sensitive data.
 
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import List, Union
+from typing import Tuple, Union
 import os
 
 
@@ -21,12 +21,13 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
     
-    # CORS settings - accepts comma-separated string or list
-    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8000", "http://127.0.0.1:8000"]
+    # CORS settings - accepts comma-separated string or list, stored frozen
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000", "http://localhost:8000", "http://127.0.0.1:8000")
     
     # Cache settings
     cache_ttl_people: int = 300  # 5 minutes
     cache_ttl_suggestions: int = 600  # 10 minutes
+    cache_max_entries: int = 1024  # LRU-evicted beyond this
     
     @field_validator('cors_origins', mode='before')
     @classmethod
@@ -34,8 +35,8 @@ class Settings(BaseSettings):
         """Parse CORS origins from comma-separated string or list."""
         if isinstance(v, str):
             # Handle comma-separated string
-            return [origin.strip() for origin in v.split(',') if origin.strip()]
-        return v
+            return tuple(origin.strip() for origin in v.split(',') if origin.strip())
+        return tuple(v)
     
     model_config = {
         "env_file": ".env",
@@ -3,38 +3,74 @@ Immich Read-Only Display - FastAPI Backend
 A thin proxy API for read-only access to Immich assets.
 """
 
-from fastapi import FastAPI, HTTPException, Query, Depends, Request
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.background import BackgroundTask
 from contextlib import asynccontextmanager
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, constr, field_validator
+import asyncio
+import importlib.util
+import logging
 import httpx
-import re
-from functools import lru_cache
+import orjson
+from functools import wraps
 from io import BytesIO
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# PIL is only needed for the rare oversized thumbnail, so it is imported on first use
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 from .config import settings
-from .cache import cache_manager
+from .cache import cache_manager, asset_type_cache
 
 
-# UUID validation pattern to prevent path traversal attacks
-UUID_PATTERN = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    re.IGNORECASE
-)
+# Configure only this module's logger; touching the root logger would also
+# surface httpx/httpcore per-request records
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    logger.addHandler(_log_handler)
+logger.propagate = False
+
+
+# Thumbnails larger than this are recompressed when PIL is available
+MAX_THUMBNAIL_BYTES = 5 * 1024 * 1024  # 5MB
+
+# Bodies up to this size are buffered and sent whole instead of streamed
+SMALL_RESPONSE_BYTES = 1024 * 1024  # 1MB
+
+# Media is passed through raw, so ask Immich not to content-encode it; this keeps
+# the forwarded Content-Length matching the bytes actually sent
+IDENTITY_ENCODING = {"Accept-Encoding": "identity"}
+
+# Chunk sizes for proxying media bodies; large chunks mean fewer event-loop
+# round-trips, while video stays smaller to keep seeking responsive
+ORIGINAL_CHUNK_SIZE = 1 << 20  # 1 MiB
+VIDEO_CHUNK_SIZE = 256 * 1024  # 256 KiB
+
+
+# Hex digits allowed in UUIDs, which are validated to prevent path traversal attacks
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+
+def is_uuid(value: str) -> bool:
+    """Check the canonical 8-4-4-4-12 hex UUID layout without the regex engine."""
+    if len(value) != 36:
+        return False
+    if not (value[8] == value[13] == value[18] == value[23] == '-'):
+        return False
+    digits = value.replace('-', '')
+    # strip() removes every hex digit, so anything left over is invalid
+    return len(digits) == 32 and not digits.strip(_HEX_DIGITS)
 
 
 def validate_uuid(value: str, field_name: str = "id") -> str:
     """Validate that a string is a valid UUID to prevent path traversal."""
-    if not value or not UUID_PATTERN.match(value):
+    if not value or not is_uuid(value):
         raise HTTPException(
             status_code=400,
             detail=f"Invalid {field_name}: must be a valid UUID"
@@ -42,21 +78,102 @@ def validate_uuid(value: str, field_name: str = "id") -> str:
     return value
 
 
+# Encoder settings shared by every recompression pass; quality is set per pass
+_JPEG_OPTS = {"format": "JPEG", "optimize": True, "progressive": True}
+
+
+def _content_length(response: httpx.Response) -> Optional[int]:
+    """Parse the upstream Content-Length, treating a missing or malformed value as unknown."""
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _compress_jpeg(content: bytes, content_type: str) -> Tuple[bytes, str]:
+    """Recompress an oversized image as JPEG. Blocking; run in a worker thread."""
+    from PIL import Image
+    
+    img = Image.open(BytesIO(content))
+    # Convert RGBA to RGB if needed (for JPEG), extracting only the alpha band
+    if img.mode == 'RGBA' and 'jpeg' in content_type.lower():
+        rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+        rgb_img.paste(img, mask=img.getchannel('A'))
+        img = rgb_img
+    
+    # One encode at good quality, and a single lower-quality retry if still too big
+    output = BytesIO()
+    save = img.save
+    for quality in (80, 60):
+        output.seek(0)
+        output.truncate()
+        save(output, quality=quality, **_JPEG_OPTS)
+        if output.tell() <= MAX_THUMBNAIL_BYTES:
+            break
+    
+    return output.getvalue(), "image/jpeg"
+
+
+def ttl_cached(key: str, ttl: int, max_age: int = 60):
+    """
+    Cache an endpoint's JSON result in cache_manager for `ttl` seconds.
+    The encoded body is cached, concurrent misses share one call, and
+    browsers are allowed to reuse the response for `max_age` seconds.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async def load():
+                return orjson.dumps(await func(*args, **kwargs))
+            
+            body = await cache_manager.get_or_create(f"{key}:json", load, ttl=ttl)
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={"Cache-Control": f"public, max-age={max_age}"}
+            )
+        return wrapper
+    return decorator
+
+
+# How often expired cache entries are swept in the background
+CACHE_GC_INTERVAL = 60
+
+
+async def _cache_gc_loop():
+    """Periodically drop expired cache entries off the request path."""
+    while True:
+        await asyncio.sleep(CACHE_GC_INTERVAL)
+        removed = cache_manager.cleanup_expired() + asset_type_cache.cleanup_expired()
+        if removed:
+            logger.debug("Cache GC removed %d expired entries", removed)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Validate configuration on startup
     if not settings.immich_api_key:
-        print("ERROR: IMMICH_API_KEY is not configured!")
-        print(f"Current IMMICH_URL: {settings.immich_url}")
-        print("Please set IMMICH_API_KEY environment variable")
+        logger.error(
+            "IMMICH_API_KEY is not configured! Current IMMICH_URL: %s. "
+            "Please set IMMICH_API_KEY environment variable",
+            settings.immich_url
+        )
     
     # Startup: Initialize HTTP client with proper timeout config
     timeout = httpx.Timeout(30.0, read=120.0)  # Longer read timeout for large files
+    # Room for a full gallery page of parallel thumbnail fetches on warm connections
+    limits = httpx.Limits(
+        max_keepalive_connections=100,
+        max_connections=200,
+        keepalive_expiry=30.0
+    )
     app.state.http_client = httpx.AsyncClient(
         base_url=settings.immich_url,
         headers={"x-api-key": settings.immich_api_key},
         timeout=timeout,
+        limits=limits,
+        http2=True,  # Multiplexes requests when Immich is served over HTTPS
         follow_redirects=True
     )
     
@@ -64,14 +181,21 @@ async def lifespan(app: FastAPI):
     try:
         response = await app.state.http_client.get("/api/server/ping")
         if response.status_code == 200:
-            print(f"✓ Connected to Immich at {settings.immich_url}")
+            logger.info("Connected to Immich at %s", settings.immich_url)
         else:
-            print(f"✗ Immich returned status {response.status_code}")
+            logger.warning("Immich returned status %s", response.status_code)
     except Exception as e:
-        print(f"✗ Cannot connect to Immich: {e}")
+        logger.warning("Cannot connect to Immich: %s", e)
+    
+    app.state.cache_gc = asyncio.create_task(_cache_gc_loop())
     
     yield
-    # Shutdown: Close HTTP client
+    # Shutdown: Stop cache GC and close HTTP client
+    app.state.cache_gc.cancel()
+    try:
+        await app.state.cache_gc
+    except asyncio.CancelledError:
+        pass
     await app.state.http_client.aclose()
 
 
@@ -87,7 +211,7 @@ app = FastAPI(
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
@@ -106,7 +230,7 @@ def get_client(request: Request) -> httpx.AsyncClient:
 class SearchFilters(BaseModel):
     """Search filters model matching Immich's search API."""
     query: Optional[str] = Field(None, max_length=500)
-    personIds: Optional[List[str]] = None
+    personIds: Optional[List[constr(max_length=36)]] = None
     make: Optional[str] = Field(None, max_length=100)
     model: Optional[str] = Field(None, max_length=100)
     country: Optional[str] = Field(None, max_length=100)
@@ -122,9 +246,9 @@ class SearchFilters(BaseModel):
     @classmethod
     def validate_person_ids(cls, v):
         if v:
-            for pid in v:
-                if not UUID_PATTERN.match(pid):
-                    raise ValueError(f"Invalid person ID: {pid}")
+            bad = next((pid for pid in v if not is_uuid(pid)), None)
+            if bad is not None:
+                raise ValueError(f"Invalid person ID: {bad}")
         return v
 
 
@@ -158,6 +282,7 @@ async def health_check(client: httpx.AsyncClient = Depends(get_client)):
 
 
 @app.get("/api/server-info")
+@ttl_cached("server_info", ttl=600)
 async def get_server_info(client: httpx.AsyncClient = Depends(get_client)):
     """Get Immich server information."""
     try:
@@ -178,12 +303,10 @@ async def get_people(
     withHidden: bool = False
 ):
     """Get list of all people (cached)."""
-    cache_key = f"people_{withHidden}"
-    cached = cache_manager.get(cache_key)
-    if cached:
-        return cached
+    # Cache the encoded body so repeat hits skip JSON serialization
+    cache_key = f"people_{withHidden}:json"
     
-    try:
+    async def load_people():
         response = await client.get("/api/people", params={"withHidden": withHidden})
         response.raise_for_status()
         data = response.json()
@@ -195,9 +318,12 @@ async def get_people(
         named_people = [p for p in people if p.get("name")]
         named_people.sort(key=lambda x: x.get("name", "").lower())
         
-        result = {"people": named_people, "total": len(named_people)}
-        cache_manager.set(cache_key, result, ttl=300)  # Cache for 5 minutes
-        return result
+        return orjson.dumps({"people": named_people, "total": len(named_people)})
+    
+    try:
+        # Cache for 5 minutes; concurrent misses share one upstream request
+        body = await cache_manager.get_or_create(cache_key, load_people, ttl=300)
+        return Response(content=body, media_type="application/json")
     except httpx.HTTPStatusError as e:
         # Return an empty list instead of failing the whole page
         return {"people": [], "total": 0, "error": f"Failed to get people: {e.response.status_code}"}
@@ -230,12 +356,34 @@ async def get_person_thumbnail(
     validate_uuid(person_id, "person_id")
     
     try:
-        response = await client.get(f"/api/people/{person_id}/thumbnail")
+        # Stream the response to avoid buffering every face thumbnail in memory
+        req = client.build_request("GET", f"/api/people/{person_id}/thumbnail")
+        response = await client.send(req, stream=True)
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
+        
+        media_type = response.headers.get("content-type", "image/jpeg")
+        headers = {"Cache-Control": "public, max-age=3600"}
+        
+        # Small faces go out in a single send rather than through a generator
+        content_length = _content_length(response)
+        if content_length is not None and content_length <= SMALL_RESPONSE_BYTES:
+            try:
+                content = await response.aread()
+            finally:
+                await response.aclose()
+            return Response(content=content, media_type=media_type, headers=headers)
+        
+        async def stream_content():
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                yield chunk
+        
         return StreamingResponse(
-            iter([response.content]),
-            media_type=response.headers.get("content-type", "image/jpeg"),
-            headers={"Cache-Control": "public, max-age=3600"}
+            stream_content(),
+            media_type=media_type,
+            headers=headers,
+            background=BackgroundTask(response.aclose),
         )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Thumbnail not found")
@@ -245,6 +393,20 @@ async def get_person_thumbnail(
 # Search Endpoints
 # ============================================================================
 
+def _search_haystacks(items: list):
+    """Yield (haystack, item) pairs with the text-searchable fields lowercased once."""
+    for item in items:
+        exif = item.get("exifInfo") or {}
+        # NUL separators keep a query from matching across field boundaries
+        haystack = "\x00".join((
+            item.get("originalFileName") or "",
+            exif.get("description") or "",
+            exif.get("model") or "",
+            exif.get("make") or "",
+        )).lower()
+        yield haystack, item
+
+
 @app.post("/api/search")
 async def search_assets(
     filters: SearchFilters,
@@ -257,49 +419,25 @@ async def search_assets(
     """
     
     # Build the search payload for Immich's /api/search/metadata endpoint
-    search_payload = {
-        "page": filters.page,
-        "size": filters.size,
-    }
-    
+    # in one pass, skipping unset/empty filters (page and size are always >= 1).
     # NOTE: The 'query' field is intentionally NOT sent to Immich
     # because /api/search/metadata doesn't support text search.
     # Only send actual metadata filter fields that Immich understands.
-    
-    if filters.personIds and len(filters.personIds) > 0:
-        search_payload["personIds"] = filters.personIds
-    
-    if filters.make:
-        search_payload["make"] = filters.make
-    
-    if filters.model:
-        search_payload["model"] = filters.model
-    
-    if filters.country:
-        search_payload["country"] = filters.country
-    
-    if filters.city:
-        search_payload["city"] = filters.city
-    
-    if filters.state:
-        search_payload["state"] = filters.state
-    
-    if filters.takenAfter:
-        search_payload["takenAfter"] = filters.takenAfter
-    
-    if filters.takenBefore:
-        search_payload["takenBefore"] = filters.takenBefore
-    
-    if filters.type and filters.type != "ALL":
-        search_payload["type"] = filters.type
+    search_payload = {
+        key: value
+        for key, value in filters.model_dump(exclude={"query"}).items()
+        if value
+    }
+    if search_payload.get("type") == "ALL":
+        del search_payload["type"]
     
     try:
-        print(f"DEBUG: Search request - Payload: {search_payload}")
+        logger.debug("Search request payload=%s", search_payload)
         response = await client.post("/api/search/metadata", json=search_payload)
         response.raise_for_status()
         data = response.json()
         
-        print(f"DEBUG: Search response status: {response.status_code}")
+        logger.debug("Search response status=%s", response.status_code)
         
         # Normalize response based on Immich's actual response structure
         assets = data.get("assets", {})
@@ -309,20 +447,17 @@ async def search_assets(
         # If user entered a text query, filter results client-side
         # This is a fallback since Immich's metadata search doesn't support text search
         if filters.query and items:
+            # Keep the upstream count as total; the text filter is only a heuristic
             query_lower = filters.query.lower()
-            filtered_items = [
-                item for item in items
-                if (
-                    query_lower in str(item.get("originalFileName", "")).lower()
-                    or query_lower in str(item.get("exifInfo", {}).get("description", "")).lower()
-                    or query_lower in str(item.get("exifInfo", {}).get("model", "")).lower()
-                    or query_lower in str(item.get("exifInfo", {}).get("make", "")).lower()
-                )
-            ]
-            total = len(filtered_items)
-            items = filtered_items[:filters.size]  # Re-apply pagination on filtered results
+            filtered_items = []
+            for haystack, item in _search_haystacks(items):
+                if query_lower in haystack:
+                    filtered_items.append(item)
+                    if len(filtered_items) == filters.size:
+                        break
+            items = filtered_items
         
-        print(f"DEBUG: Extracted {len(items)} items, total count: {total}")
+        logger.debug("Search extracted %d items, total count=%s", len(items), total)
         
         # Calculate pagination info
         has_more = len(items) >= filters.size
@@ -345,10 +480,10 @@ async def search_assets(
             except:
                 pass
         
-        print(f"DEBUG: Search error - Status: {e.response.status_code}, Detail: {error_detail}")
+        logger.debug("Search error status=%s detail=%s", e.response.status_code, error_detail)
         raise HTTPException(status_code=e.response.status_code, detail=error_detail)
     except Exception as e:
-        print(f"DEBUG: Unexpected search error: {type(e).__name__}: {e}")
+        logger.warning("Unexpected search error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Search error: {str(e)}")
 
 
@@ -357,17 +492,18 @@ async def get_search_suggestions(
     client: httpx.AsyncClient = Depends(get_client)
 ):
     """Get search suggestions (camera makes, models, locations) for filter dropdowns."""
-    cache_key = "search_suggestions"
-    cached = cache_manager.get(cache_key)
-    if cached:
-        return cached
+    # Cache the encoded body so repeat hits skip JSON serialization
+    cache_key = "search_suggestions:json"
     
-    try:
+    async def load_suggestions():
         response = await client.get("/api/search/suggestions")
         response.raise_for_status()
-        data = response.json()
-        cache_manager.set(cache_key, data, ttl=600)  # Cache for 10 minutes
-        return data
+        return orjson.dumps(response.json())
+    
+    try:
+        # Cache for 10 minutes; concurrent misses share one upstream request
+        body = await cache_manager.get_or_create(cache_key, load_suggestions, ttl=600)
+        return Response(content=body, media_type="application/json")
     except httpx.HTTPStatusError:
         # Return empty suggestions if endpoint not available
         return {
@@ -414,6 +550,22 @@ async def get_assets(
         raise HTTPException(status_code=e.response.status_code, detail="Failed to get assets")
 
 
+# An asset's type never changes, so it can be cached for a long time
+ASSET_TYPE_TTL = 3600
+
+
+async def _get_asset_type(client: httpx.AsyncClient, asset_id: str) -> Optional[str]:
+    """Get an asset's type (IMAGE/VIDEO), fetching its metadata only on a cache miss."""
+    async def load_type():
+        response = await client.get(f"/api/assets/{asset_id}")
+        response.raise_for_status()
+        return response.json().get("type")
+    
+    return await asset_type_cache.get_or_create(
+        f"asset_type:{asset_id}", load_type, ttl=ASSET_TYPE_TTL
+    )
+
+
 @app.get("/api/assets/{asset_id}")
 async def get_asset(
     asset_id: str,
@@ -425,7 +577,11 @@ async def get_asset(
     try:
         response = await client.get(f"/api/assets/{asset_id}")
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        # Prime the type cache so a following download skips the metadata lookup
+        if data.get("type"):
+            asset_type_cache.set(f"asset_type:{asset_id}", data["type"], ttl=ASSET_TYPE_TTL)
+        return data
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Asset not found")
 
@@ -440,43 +596,55 @@ async def get_asset_thumbnail(
     validate_uuid(asset_id, "asset_id")
     
     try:
-        response = await client.get(
+        req = client.build_request(
+            "GET",
             f"/api/assets/{asset_id}/thumbnail",
             params={"size": size}
         )
+        response = await client.send(req, stream=True)
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
         
-        content = response.content
         content_type = response.headers.get("content-type", "image/jpeg")
+        content_length = _content_length(response)
+        
+        # Stream straight through unless the image may need compressing;
+        # without a Content-Length we have to buffer it to find out
+        if not PIL_AVAILABLE or (
+            content_length is not None and content_length <= MAX_THUMBNAIL_BYTES
+        ):
+            async def stream_content():
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    yield chunk
+            
+            return StreamingResponse(
+                stream_content(),
+                media_type=content_type,
+                headers={
+                    "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+                },
+                background=BackgroundTask(response.aclose),
+            )
+        
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
         
-        # Compress image if it exceeds 5MB and PIL is available
-        if PIL_AVAILABLE and len(content) > 5 * 1024 * 1024:  # 5MB
+        # Compress image if it exceeds 5MB
+        if len(content) > MAX_THUMBNAIL_BYTES:
             try:
-                img = Image.open(BytesIO(content))
-                # Convert RGBA to RGB if needed (for JPEG)
-                if img.mode == 'RGBA' and 'jpeg' in content_type.lower():
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    rgb_img.paste(img, mask=img.split()[3])
-                    img = rgb_img
-                
-                # Compress with quality reduction
-                output = BytesIO()
-                # Start with high quality and reduce if needed
-                for quality in [85, 75, 65, 55]:
-                    output.seek(0)
-                    output.truncate(0)
-                    img.save(output, format='JPEG', quality=quality, optimize=True)
-                    if output.tell() <= 5 * 1024 * 1024:
-                        break
-                
-                content = output.getvalue()
-                content_type = "image/jpeg"
+                # Encode off the event loop so other requests keep flowing
+                content, content_type = await asyncio.to_thread(
+                    _compress_jpeg, content, content_type
+                )
             except Exception as e:
                 # If compression fails, return original
-                print(f"Warning: Failed to compress image {asset_id}: {e}")
+                logger.warning("Failed to compress image %s: %s", asset_id, e)
         
-        return StreamingResponse(
-            iter([content]),
+        return Response(
+            content=content,
             media_type=content_type,
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
@@ -496,14 +664,19 @@ async def get_asset_original(
     
     try:
         # Stream the response to avoid loading entire file into memory
-        req = client.build_request("GET", f"/api/assets/{asset_id}/original")
+        req = client.build_request(
+            "GET",
+            f"/api/assets/{asset_id}/original",
+            headers=IDENTITY_ENCODING
+        )
         response = await client.send(req, stream=True)
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
         
         async def stream_content():
-            async for chunk in response.aiter_bytes(chunk_size=65536):
+            async for chunk in response.aiter_raw(chunk_size=ORIGINAL_CHUNK_SIZE):
                 yield chunk
-            await response.aclose()
         
         return StreamingResponse(
             stream_content(),
@@ -511,7 +684,8 @@ async def get_asset_original(
             headers={
                 "Cache-Control": "public, max-age=3600",
                 "Content-Length": response.headers.get("content-length", ""),
-            }
+            },
+            background=BackgroundTask(response.aclose),
         )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Asset not found")
@@ -527,14 +701,17 @@ async def download_asset(
     
     try:
         # Block video downloads while allowing photos
-        meta_resp = await client.get(f"/api/assets/{asset_id}")
-        meta_resp.raise_for_status()
-        asset_meta = meta_resp.json()
-        if asset_meta.get("type") == "VIDEO":
+        if await _get_asset_type(client, asset_id) == "VIDEO":
             raise HTTPException(status_code=403, detail="Video downloads are disabled")
 
-        req = client.build_request("GET", f"/api/assets/{asset_id}/original")
+        req = client.build_request(
+            "GET",
+            f"/api/assets/{asset_id}/original",
+            headers=IDENTITY_ENCODING
+        )
         response = await client.send(req, stream=True)
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
 
         filename = None
@@ -545,9 +722,8 @@ async def download_asset(
             filename = f"{asset_id}.bin"
 
         async def stream_content():
-            async for chunk in response.aiter_bytes(chunk_size=65536):
+            async for chunk in response.aiter_raw(chunk_size=ORIGINAL_CHUNK_SIZE):
                 yield chunk
-            await response.aclose()
         
         headers = {
             "Content-Disposition": f"attachment; filename=\"{filename}\"",
@@ -561,7 +737,8 @@ async def download_asset(
         return StreamingResponse(
             stream_content(),
             media_type=response.headers.get("content-type", "application/octet-stream"),
-            headers=headers
+            headers=headers,
+            background=BackgroundTask(response.aclose),
         )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Asset not found")
@@ -579,7 +756,7 @@ async def get_video_playback(
     # Always send a Range header to encourage partial responses; forward the client's Range if present
     client_range = request.headers.get("range")
     range_header = client_range if client_range else "bytes=0-"
-    forward_headers = {"Range": range_header}
+    forward_headers = {"Range": range_header, **IDENTITY_ENCODING}
     
     try:
         req = client.build_request(
@@ -588,12 +765,13 @@ async def get_video_playback(
             headers=forward_headers
         )
         response = await client.send(req, stream=True)
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
         
         async def stream_content():
-            async for chunk in response.aiter_bytes(chunk_size=65536):
+            async for chunk in response.aiter_raw(chunk_size=VIDEO_CHUNK_SIZE):
                 yield chunk
-            await response.aclose()
         
         # Propagate relevant streaming headers
         headers = {
@@ -609,7 +787,8 @@ async def get_video_playback(
             stream_content(),
             status_code=response.status_code,
             media_type=response.headers.get("content-type", "video/mp4"),
-            headers=headers
+            headers=headers,
+            background=BackgroundTask(response.aclose),
         )
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=e.response.status_code, detail="Video not found")
@@ -620,6 +799,7 @@ async def get_video_playback(
 # ============================================================================
 
 @app.get("/api/statistics")
+@ttl_cached("statistics", ttl=60)
 async def get_statistics(
     client: httpx.AsyncClient = Depends(get_client)
 ):